@@ -17,8 +17,22 @@ copies or substantial portions of the Software.
 
 You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
+import warnings
+from os import getenv
+
 from loguru import logger
 
 __version__ = '2.2.0'
 # Because this is a library; use logger.enable('base_client_api) in script to see log msgs.
 logger.disable(__name__)
+
+# Opt-in: export BCA_UVLOOP=1 to run on uvloop (pip install base-client-api[uvloop]); not available on Windows.
+if getenv('BCA_UVLOOP') == '1':
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        # The library logger is disabled above, so surface this where the user will see it.
+        warnings.warn('BCA_UVLOOP=1 but uvloop is not installed; using the default asyncio event loop.',
+                      RuntimeWarning, stacklevel=2)
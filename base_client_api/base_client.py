@@ -18,25 +18,272 @@ copies or substantial portions of the Software.
 You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
 import asyncio
-from asyncio import Semaphore
+import json
+from copy import deepcopy
+from functools import lru_cache
 from json.decoder import JSONDecodeError
 from logging import DEBUG, WARNING
-from os import getenv
+from operator import itemgetter
+from os import environ, stat
+from os.path import realpath
+from pathlib import Path
 from pprint import pformat
 from ssl import create_default_context, Purpose, SSLContext
-from typing import List, Optional, Union
+from typing import Any, List, NoReturn, Optional, Tuple, Union
 from urllib.parse import unquote_plus
 
 import aiohttp as aio
-import rapidjson
-import toml
+import orjson
 from loguru import logger
 from rich import print
 from tenacity import after_log, before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from base_client_api.models.record import Record
-from base_client_api.models.results import Results
+from base_client_api.models.results import json_loads, LazyRecord, Results
 
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import toml as tomllib
+
+
+def _env_bool(value: str) -> bool:
+    """Environment Boolean
+
+    Args:
+        value (str): e.g. 1, true, yes, on (any case) -> True; anything else -> False
+
+    Returns:
+        (bool)"""
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# Environment variable -> (section, key), converter; overrides applied on top of the loaded config.
+_ENV_MAP = (('Auth_Username', ('Auth', 'Username'), str),
+            ('Auth_Password', ('Auth', 'Password'), str),
+            ('Auth_Header', ('Auth', 'Header'), str),
+            ('Auth_Token', ('Auth', 'Token'), str),
+            ('URI_Base', ('URI', 'Base'), str),
+            ('Options_CAPath', ('Options', 'CAPath'), str),
+            ('Options_VerifySSL', ('Options', 'VerifySSL'), _env_bool),
+            ('Options_Debug', ('Options', 'Debug'), _env_bool),
+            ('Options_SEM', ('Options', 'SEM'), int),
+            ('Proxy_URI', ('Proxy', 'URI'), str),
+            ('Proxy_Port', ('Proxy', 'Port'), str),
+            ('Proxy_Username', ('Proxy', 'Username'), str),
+            ('Proxy_Password', ('Proxy', 'Password'), str))
+
+
+@lru_cache(maxsize=None)
+def _env_overrides() -> Tuple[Tuple[str, str, Any], ...]:
+    """Environment Overrides
+
+    Snapshot of the set environment variables in _ENV_MAP, converted to their config types;
+    read once per process.
+
+    Returns:
+        (Tuple[Tuple[str, str, Any], ...]): (section, key, value)"""
+    return tuple((section, key, convert(val))
+                 for var, (section, key), convert in _ENV_MAP if (val := environ.get(var)))
+
+
+def refresh_env_cache() -> NoReturn:
+    """Refresh Environment Cache
+
+    Discards the environment snapshot so the next client picks up changed variables.
+
+    Returns:
+        (NoReturn)"""
+    _env_overrides.cache_clear()
+
+
+def _section(cfg: Optional[dict], name: str) -> dict:
+    """Section
+
+    Returns a top-level configuration section, or an empty dict if it is missing or not a table.
+
+    Args:
+        cfg (Optional[dict]):
+        name (str): e.g. 'Options'
+
+    Returns:
+        (dict)"""
+    section = cfg.get(name) if isinstance(cfg, dict) else None
+
+    return section if isinstance(section, dict) else {}
+
+
+def _deep_update(dst: dict, src: dict) -> dict:
+    """Deep Update
+
+    Recursively merges src into dst; nested dictionaries are merged, other values replaced.
+    Nested dictionaries from src are copied so later merges never modify the source.
+
+    Args:
+        dst (dict):
+        src (dict):
+
+    Returns:
+        dst (dict)"""
+    for k, v in src.items():
+        if type(v) is dict:
+            if type(dst.get(k)) is not dict:
+                dst[k] = {}
+
+            _deep_update(dst[k], v)
+        else:
+            dst[k] = v
+
+    return dst
+
+
+@lru_cache(maxsize=32)
+def _parse_toml_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse TOML File
+
+    Cached on (path, mtime_ns, size) so re-creating a client from an unchanged file skips the
+    read and parse; callers receive a copy (see _load_cfg_file).
+
+    Args:
+        path (str): resolved path to a .toml file
+        mtime_ns (int): part of the cache key only
+        size (int): part of the cache key only
+
+    Returns:
+        (dict)"""
+    return tomllib.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def _load_cfg_file(path: str) -> dict:
+    """Load Configuration File
+
+    Only TOML parses are cached; orjson parses a JSON file faster than the cache lookup and copy.
+
+    Args:
+        path (str): path to a .toml or .json file
+
+    Returns:
+        (dict): a private copy of the parse result"""
+    if not path.endswith('.toml'):
+        return orjson.loads(Path(path).read_bytes())
+
+    path = realpath(path)
+    st = stat(path)
+
+    return deepcopy(_parse_toml_file(path, st.st_mtime_ns, st.st_size))
+
+
+def _copy_records(data: Any) -> Any:
+    """Copy Records
+
+    Shallow-copies a parsed record, or each record in a list; other values are returned as-is.
+
+    Args:
+        data (Any):
+
+    Returns:
+        (Any)"""
+    if type(data) is list:
+        return [r.copy() if type(r) is dict else r for r in data]
+    elif type(data) is dict:
+        return data.copy()
+
+    return data
+
+
+@lru_cache(maxsize=8)
+def _ssl_context(capath: str) -> SSLContext:
+    """SSL Context
+
+    Loading a CA path parses every certificate in it; contexts are shared by all clients using the same path.
+
+    Args:
+        capath (str):
+
+    Returns:
+        (SSLContext)"""
+    return create_default_context(purpose=Purpose.CLIENT_AUTH, capath=capath)
+
+
+def _json_dumps(obj: Any) -> str:
+    """JSON Dumps
+
+    aiohttp expects a str from json_serialize; orjson produces UTF-8 bytes.
+    Bodies orjson can't encode (e.g. integers beyond 64 bits) fall back to json.dumps.
+
+    Args:
+        obj (Any):
+
+    Returns:
+        (str)"""
+    try:
+        return orjson.dumps(obj).decode('utf-8')
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+async def _as_jwt(result: aio.ClientResponse) -> dict:
+    return {'token': (await result.read()).decode('ascii'), 'token_type': 'Bearer'}  # JWTs are base64url + dots
+
+
+async def _as_json(result: aio.ClientResponse) -> Any:
+    if raw := (await result.read()).strip():
+        return json_loads(raw)
+
+    return None
+
+
+async def _as_problem(result: aio.ClientResponse) -> Any:
+    response = await _as_json(result)
+    logger.error(await BaseClientApi.request_debug(result))
+
+    return response
+
+
+async def _as_text_plain(result: aio.ClientResponse) -> dict:
+    return {'text_plain': (await result.read()).decode('utf-8')}
+
+
+async def _as_text_html(result: aio.ClientResponse) -> dict:
+    return {'text_html': (await result.read()).decode('utf-8')}
+
+
+async def _as_unknown(result: aio.ClientResponse) -> str:
+    logger.error(f'Content-Type: {result.headers["Content-Type"]} is not currently handled.')
+
+    return (await result.read()).decode('utf-8')
+
+
+@lru_cache(maxsize=64)
+def _media_type(content_type: str) -> str:
+    """Media Type
+
+    Content-Type without parameters, lower case; e.g. 'application/json; charset=utf-8' -> 'application/json'.
+    Responses from one API repeat a handful of header values, so results are cached.
+
+    Args:
+        content_type (str):
+
+    Returns:
+        (str)"""
+    return content_type.partition(';')[0].strip().lower()
+
+
+# Media types whose bodies are decoded as JSON.
+_JSON_CTS = frozenset({'application/json', 'application/javascript', 'text/javascript'})
+
+# HTTP verbs accepted by request(); model.method is upper-cased before checking.
+_METHODS = frozenset({'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PATCH', 'POST', 'PUT'})
+
+# Accepted process_results sort_order values, lower case; '' means unsorted.
+_SORT_ORDERS = frozenset({'', 'asc', 'desc'})
+
+# Response body handlers keyed by media type (Content-Type without parameters, lower case).
+_CT_HANDLERS = {**dict.fromkeys(_JSON_CTS, _as_json),
+                'application/jwt': _as_jwt,
+                'text/plain': _as_text_plain,
+                'text/html': _as_text_html,
+                'application/problem+json': _as_problem}
 
 # todo: handle form data
 # todo: add AWS secrets manager to config load
@@ -44,19 +291,86 @@ from base_client_api.models.results import Results
 # todo: switch to pydantic settings loader?
 
 
+class _AdmissionController:
+    """Admission Controller
+
+    Concurrency limit that, unlike asyncio.Semaphore, can be resized while requests are in flight.
+    Used as an async context manager: `async with controller: ...`"""
+    __slots__ = ('_active', '_cond', '_limit')
+
+    def __init__(self, limit: int):
+        self._active: int = 0
+        self._cond: asyncio.Condition = asyncio.Condition()
+        self._limit: int = max(1, limit)
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    async def acquire(self) -> NoReturn:
+        async with self._cond:
+            try:
+                await self._cond.wait_for(lambda: self._active < self._limit)
+            except asyncio.CancelledError:
+                self._cond.notify(1)  # Pass on a wake-up this waiter may have consumed.
+                raise
+
+            self._active += 1
+
+    async def release(self) -> NoReturn:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> NoReturn:
+        """Set Limit
+
+        Lowering the limit lets in-flight requests finish; new ones wait until below it.
+
+        Args:
+            limit (int): minimum 1
+
+        Returns:
+            (NoReturn)"""
+        async with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
+
+
 class BaseClientApi:
     """Base Client API"""
     HDR: dict = {'Content-Type': 'application/json; charset=utf-8', 'Accept': 'application/json'}
     SEM: int = 5  # This defines the number of parallel requests to make.
-
-    def __init__(self, cfg: Optional[Union[str, dict]] = None):
+    LAZY_DECODE: bool = False  # Store 2xx JSON object bodies as LazyRecord; decoded on first access.
+    COPY_ON_OUTPUT: bool = False  # Shallow-copy parsed records before adding them to Results.
+    BREAKER_THRESHOLD: int = 3  # Consecutive 5xx/connection failures before concurrency is halved.
+    MAX_CONNS: int = 100  # Connection pool size shared by all hosts.
+    MAX_CONNS_PER_HOST: int = 30  # Connection pool size per host.
+    DNS_TTL: int = 300  # Seconds to cache DNS lookups.
+    KEEPALIVE: int = 30  # Seconds an idle connection is kept for reuse.
+    TIMEOUT: int = 300  # Seconds allowed for a whole request, including connecting and reading the body.
+
+    def __init__(self, cfg: Optional[Union[str, dict, List[Union[str, dict]]]] = None):
         self.debug: bool = False
         self.auth: Optional[aio.BasicAuth] = None
         self.proxy: Optional[str] = None
         self.proxy_auth: Optional[aio.BasicAuth] = None
-        self.sem: Optional[Semaphore] = None
+        self.sem: Optional[_AdmissionController] = None
         self.session: Optional[aio.ClientSession] = None
         self.ssl: Optional[SSLContext] = None
+        self.uri_base: str = ''
+        self._failures: int = 0  # Consecutive server/connection failures; see _breaker_failure
+        self._sem_size: int = self.SEM
 
         self.cfg = self.__load_config_data(cfg)
         self.process_config(self.cfg)
@@ -69,68 +383,57 @@ class BaseClientApi:
         await self.session.close()
 
     @staticmethod
-    def __load_config_data(cfg_data: Union[str, dict]) -> dict:
-        """Load Configuration Data
+    def __parse_config(cfg_data: Union[str, dict]) -> Optional[dict]:
+        """Parse Configuration
 
         Args:
-            cfg_data (Union[str, dict): str; path to config file [toml|json]
-                                   dict; dictionary matching config example
-                Values expressed in example config can be overridden by OS
-                environment variables.
+            cfg_data (Union[str, dict]): str; path to config file [toml|json]
+                                         dict; dictionary matching config example
+
+        Raises:
+            NotImplementedError
 
         Returns:
-            cfg (dict)"""
-        if type(cfg_data) is dict:
-            cfg = cfg_data
-        elif type(cfg_data) is str:
-            if cfg_data.endswith('.toml'):
-                cfg = toml.load(cfg_data)
-            elif cfg_data.endswith('.json'):
-                cfg = rapidjson.loads(open(cfg_data).read(), ensure_ascii=False)
+            cfg (Optional[dict])"""
+        if isinstance(cfg_data, dict):
+            return cfg_data
+        elif isinstance(cfg_data, str):
+            if cfg_data.endswith(('.toml', '.json')):
+                return _load_cfg_file(cfg_data)
             else:
-                logger.error(f'Unknown configuration file type: {cfg_data.split(".")[1]}\n-> Valid Types: .toml | .json')
+                logger.error(f'Unknown configuration file type: {cfg_data.rsplit(".", 1)[-1]}\n-> Valid Types: .toml | .json')
                 raise NotImplementedError
-        else:
-            cfg = None
-
-        if env_auth_user := getenv('Auth_Username'):
-            cfg['Auth']['Username'] = env_auth_user
-
-        if env_auth_pass := getenv('Auth_Password'):
-            cfg['Auth']['Password'] = env_auth_pass
-
-        if env_auth_header := getenv('Auth_Header'):
-            cfg['Auth']['Header'] = env_auth_header
-
-        if env_auth_token := getenv('Auth_Token'):
-            cfg['Auth']['Token'] = env_auth_token
-
-        if env_uri_base := getenv('URI_Base'):
-            cfg['URI']['Base'] = env_uri_base
-
-        if env_opt_ca := getenv('Options_CAPath'):
-            cfg['Options']['CAPath'] = env_opt_ca
-
-        if env_opt_ssl := getenv('Options_VerifySSL'):
-            cfg['Options']['VerifySS:'] = env_opt_ssl
 
-        if env_opt_dbg := getenv('Options_Debug'):
-            cfg['Options']['Ddebug'] = env_opt_dbg
+        return None
 
-        if env_opt_sem := getenv('Options_SEM'):
-            cfg['Options']['SEM'] = env_opt_sem
+    @staticmethod
+    def __load_config_data(cfg_data: Optional[Union[str, dict, List[Union[str, dict]]]]) -> Optional[dict]:
+        """Load Configuration Data
 
-        if env_prxy_uri := getenv('Proxy_URI'):
-            cfg['Proxy']['URI'] = env_prxy_uri
+        Args:
+            cfg_data (Optional[Union[str, dict, List[Union[str, dict]]]]):
+                str; path to config file [toml|json]
+                dict; dictionary matching config example
+                list; of the above, deep-merged in order (later entries win)
+                Values expressed in example config can be overridden by OS
+                environment variables; these are read once per process,
+                see refresh_env_cache().
 
-        if env_prxy_port := getenv('Proxy_Port'):
-            cfg['Proxy']['Port'] = env_prxy_port
+        Returns:
+            cfg (Optional[dict])"""
+        if isinstance(cfg_data, (list, tuple)):
+            cfg = {}
+            for c in cfg_data:
+                if (sub_cfg := BaseClientApi.__parse_config(c)) is not None:
+                    _deep_update(cfg, sub_cfg)
+        else:
+            cfg = BaseClientApi.__parse_config(cfg_data)
 
-        if env_prxy_user := getenv('Proxy_Username'):
-            cfg['Proxy']['Username'] = env_prxy_user
+        for section, key, val in _env_overrides():
+            if cfg is None:
+                cfg = {}
 
-        if env_prxy_pass := getenv('Proxy_Password'):
-            cfg['Proxy']['Password'] = env_prxy_pass
+            cfg.setdefault(section, {})[key] = val
 
         return cfg
 
@@ -142,38 +445,19 @@ class BaseClientApi:
 
         Returns:
             (bool)"""
-        try:
-            if cfg_data['Options']['Debug']:
-                self.debug = True
-        except (KeyError, TypeError):
-            self.debug = False
+        auth, opts, proxy = _section(cfg_data, 'Auth'), _section(cfg_data, 'Options'), _section(cfg_data, 'Proxy')
 
-        try:
-            if usr := cfg_data['Auth']['Username']:
-                if pwd := cfg_data['Auth']['Password']:
-                    self.auth = aio.BasicAuth(login=usr, password=pwd)
-        except (KeyError, TypeError):
-            pass  # If we don't have credentials we don't need to create this.
-
-        try:
-            proxy_uri = cfg_data['Proxy']['URI']
-        except (KeyError, TypeError):
-            proxy_uri = None
+        self.debug = bool(opts.get('Debug'))
+        self.uri_base = _section(cfg_data, 'URI').get('Base') or ''
 
-        try:
-            proxy_port = cfg_data['Proxy']['Port']
-        except (KeyError, TypeError):
-            proxy_port = ''
+        if usr := auth.get('Username'):
+            if pwd := auth.get('Password'):
+                self.auth = aio.BasicAuth(login=usr, password=pwd)
 
-        try:
-            proxy_user = cfg_data['Proxy']['Username']
-        except (KeyError, TypeError):
-            proxy_user = None
-
-        try:
-            proxy_pass = cfg_data['Proxy']['Password']
-        except (KeyError, TypeError):
-            proxy_pass = None
+        proxy_uri = proxy.get('URI')
+        proxy_port = proxy.get('Port', '')
+        proxy_user = proxy.get('Username')
+        proxy_pass = proxy.get('Password')
 
         if proxy_uri:
             self.proxy = f'{proxy_uri}{":" if proxy_port else ""}{proxy_port}'
@@ -181,25 +465,14 @@ class BaseClientApi:
         if proxy_user:
             self.proxy_auth = aio.BasicAuth(login=proxy_user, password=proxy_pass)
 
-        try:
-            sem = cfg_data['Options']['SEM']
-        except (KeyError, TypeError):
-            sem = self.SEM
-
-        self.sem = asyncio.Semaphore(sem)
+        self._sem_size = int(opts.get('SEM', self.SEM))
+        self.sem = _AdmissionController(self._sem_size)
 
-        try:
-            ca_key = cfg_data['Options']['CAPath']
-        except (KeyError, TypeError):
-            ca_key = None
-
-        try:
-            verify_ssl = cfg_data['Options']['VerifySSL']
-        except (KeyError, TypeError):
-            verify_ssl = False
+        ca_key = opts.get('CAPath')
+        verify_ssl = opts.get('VerifySSL', False)
 
         if ca_key:
-            self.ssl = create_default_context(purpose=Purpose.CLIENT_AUTH, capath=ca_key)
+            self.ssl = _ssl_context(ca_key)
         else:
             self.ssl = verify_ssl
 
@@ -213,16 +486,11 @@ class BaseClientApi:
 
         Returns:
             (bool)"""
-        # Auth
-        try:
-            username = cfg['Auth']['Username']
-        except (KeyError, TypeError):
-            username = None
+        auth_cfg, opts = _section(cfg, 'Auth'), _section(cfg, 'Options')
 
-        try:
-            password = cfg['Auth']['Password']
-        except (KeyError, TypeError):
-            password = None
+        # Auth
+        username = auth_cfg.get('Username')
+        password = auth_cfg.get('Password')
 
         if username or password:
             auth = aio.BasicAuth(login=username, password=password)
@@ -230,46 +498,76 @@ class BaseClientApi:
             auth = None
 
         # Cookies; Can't be overwridden by env_vars; Must be a dct
-        try:
-            cookies = cfg['Cache']['Cookies']
-        except (KeyError, TypeError):
-            cookies = None
-
-        try:
-            cookie_jar_unsafe = cfg['Options']['CookieJar_Unsafe']
-        except (KeyError, TypeError):
-            cookie_jar_unsafe = False
+        cookies = _section(cfg, 'Cache').get('Cookies')
+        cookie_jar_unsafe = opts.get('CookieJar_Unsafe', False)
 
         # Headers
-        try:
-            auth_hdr = cfg['Auth']['Header']
-        except (KeyError, TypeError):
-            auth_hdr = None
-
-        try:
-            auth_tkn = cfg['Auth']['Token']
-        except (KeyError, TypeError):
-            auth_tkn = None
-
-        try:
-            content_type = cfg['Options']['Content_type']
-        except (KeyError, TypeError):
-            content_type = 'application/json; charset=utf-8'
+        auth_hdr = auth_cfg.get('Header')
+        auth_tkn = auth_cfg.get('Token')
+        content_type = opts.get('Content_type', 'application/json; charset=utf-8')
 
         if auth_hdr and auth_tkn:
             hdrs = {'Content-Type': content_type, auth_hdr: auth_tkn}
         else:
             hdrs = self.HDR
 
+        # The connector carries the SSL setting for every request and keeps connections alive for reuse;
+        # the per-host default never drops below SEM so admitted requests don't queue for a socket.
+        connector = aio.TCPConnector(limit=int(opts.get('MaxConns', self.MAX_CONNS)),
+                                     limit_per_host=int(opts.get('MaxConnsPerHost', max(self.MAX_CONNS_PER_HOST, self._sem_size))),
+                                     ssl=self.ssl,
+                                     ttl_dns_cache=self.DNS_TTL,
+                                     keepalive_timeout=self.KEEPALIVE)
+
         self.session = aio.ClientSession(auth=auth,
+                                         connector=connector,
                                          cookies=cookies,
                                          cookie_jar=aio.CookieJar(unsafe=cookie_jar_unsafe),
                                          headers=hdrs,
-                                         json_serialize=rapidjson.dumps,
-                                         timeout=aio.ClientTimeout(total=300))
+                                         json_serialize=_json_dumps,
+                                         timeout=aio.ClientTimeout(total=float(opts.get('Timeout', self.TIMEOUT))))
 
         return True
 
+    async def set_concurrency(self, limit: int) -> NoReturn:
+        """Set Concurrency
+
+        Changes the number of parallel requests (the configured SEM) at runtime.
+
+        Args:
+            limit (int): minimum 1
+
+        Returns:
+            (NoReturn)"""
+        self._sem_size = max(1, limit)
+        self._failures = 0
+        await self.sem.set_limit(self._sem_size)
+
+    async def _breaker_failure(self) -> NoReturn:
+        """Breaker Failure
+
+        Halves request concurrency after BREAKER_THRESHOLD consecutive server/connection failures,
+        so retries back off the whole pool instead of multiplying load on a failing server.
+
+        Returns:
+            (NoReturn)"""
+        self._failures += 1
+        if self._failures >= self.BREAKER_THRESHOLD and (limit := self.sem.limit) > 1:
+            self._failures = 0
+            await self.sem.set_limit(limit // 2)
+            logger.warning(f'Repeated request failures; concurrency reduced to {self.sem.limit}')
+
+    async def _breaker_success(self) -> NoReturn:
+        """Breaker Success
+
+        Resets the failure count and doubles reduced concurrency back towards the configured SEM.
+
+        Returns:
+            (NoReturn)"""
+        self._failures = 0
+        if (limit := self.sem.limit) < self._sem_size:
+            await self.sem.set_limit(min(limit * 2, self._sem_size))
+
     @staticmethod
     async def request_debug(response: aio.ClientResponse) -> str:
         """Request Debug
@@ -306,6 +604,55 @@ class BaseClientApi:
                f'\n\t[bold yellow]Response-JSON:[/bold yellow] \n{json}\n' \
                f'\n\t[bold yellow]Response-TEXT:[/bold yellow] \n\t\t{text}\n'
 
+    async def _process_one(self, results: Results, result: aio.ClientResponse, response_key: Optional[str]) -> NoReturn:
+        """Process One Response
+
+        Parses a single response and appends it to results.success or results.failure.
+
+        Args:
+            results (Results):
+            result (aio.ClientResponse):
+            response_key (Optional[str]): Key holding the records in the response; see Record.response_key
+
+        Returns:
+            (NoReturn)"""
+        status = result.status
+
+        if (content_type := result.headers.get('Content-Type')) is None:
+            logger.warning(f'No Content-Type returned from {result.url}')
+            response = (await result.read()).decode('utf-8')
+        else:
+            media_type = _media_type(content_type)
+
+            if self.LAZY_DECODE and 200 <= status <= 299 and media_type in _JSON_CTS and response_key is None:
+                raw = await result.read()
+                if raw.lstrip()[:1] == b'{':  # Only single objects; arrays are split into records below.
+                    results.success.append(LazyRecord(raw))
+                    return
+
+            response = await _CT_HANDLERS.get(media_type, _as_unknown)(result)
+
+        # This is for when the 'Content-Type' is specified as non-text but is actually returned as a string by the API.
+        if type(response) is str and response:
+            response = {'text_plain': response}
+
+        if 200 <= status <= 299:
+            try:
+                data = response[response_key]
+            except (KeyError, TypeError):
+                data = response
+
+            if self.COPY_ON_OUTPUT:
+                data = _copy_records(data)
+
+            if type(data) is list:
+                results.success.extend(data)
+            else:
+                results.success.append(data)
+
+        elif status > 299:
+            results.failure.append(_copy_records(response) if self.COPY_ON_OUTPUT else response)
+
     async def process_results(self, results: Results,
                               model: Record,
                               cleanup: bool = False,
@@ -313,97 +660,46 @@ class BaseClientApi:
                               sort_order: Optional[str] = None) -> Results:
         """Process Results from aio.ClientRequest(s)
 
+        Responses already parsed into success/failure (the first results.parsed, e.g. by make_request)
+        are not parsed again.
+
         Args:
         results (List[Union[dct, aio.ClientResponse]]):
         success (List[dct]):
         failure (List[dct]):
-        model   (Record):
+        model   (Record): Instance used for response_key; records under that key are returned as-is.
         cleanup (Optional[bool]):
             Removes raw results, Removes empty (None) keys, and Sorts Keys of each record.
         sort_field (Optional[str]): Top incident_level dictionary key to sort on
         sort_order (Optional[str]): Direction to sort ASC | DESC (any case)
             Performs generic sort if sort_field not specified.
 
+        Raises:
+            ValueError: sort_order is not ASC or DESC
+
         Returns:
             results (Results): """
-        for result in results.responses:
-            status = result.status
+        if (order := (sort_order or '').lower()) not in _SORT_ORDERS:
+            logger.error(f'Invalid sort_order: {sort_order}\n-> Valid Orders: ASC | DESC')
+            raise ValueError(sort_order)
 
-            try:
-                # todo: switch to pattern matching/case statement in python 3.10
-                if result.headers['Content-Type'].startswith('application/jwt'):
-                    response = {'token': await result.text(encoding='utf-8'), 'token_type': 'Bearer'}
-
-                elif result.headers['Content-Type'].startswith('application/json'):
-                    response = await result.json(encoding='utf-8', loads=rapidjson.loads)
-
-                elif result.headers['Content-Type'].startswith('application/javascript'):
-                    response = await result.json(encoding='utf-8', loads=rapidjson.loads,
-                                                 content_type='application/javascript')
-
-                elif result.headers['Content-Type'].startswith('text/javascript'):
-                    response = await result.json(encoding='utf-8', loads=rapidjson.loads,
-                                                 content_type='text/javascript')
-
-                elif result.headers['Content-Type'].startswith('text/plain'):
-                    response = {'text_plain': await result.text(encoding='utf-8')}
-
-                elif result.headers['Content-Type'].startswith('text/html'):
-                    response = {'text_html': await result.text(encoding='utf-8')}
-
-                elif result.headers['Content-Type'].startswith('application/problem+json'):
-                    response = await result.json(encoding='utf-8', loads=rapidjson.loads)
-                    logger.error(await self.request_debug(response))
-
-                else:
-                    logger.error(f'Content-Type: {result.headers["Content-Type"]} is not currently handled.')
-                    response = await result.text(encoding='utf-8')
-
-            except KeyError as ke:  # No Content-Type returned
-                logger.warning(ke)
-                response = await result.text(encoding='utf-8')
-
-            # This is for when the 'Content-Type' is specified as non-text but is actually returned as a string by the API.
-            if type(response) == str and len(response):
-                response = {'text_plain': await result.text(encoding='utf-8')}
-
-            if 200 <= status <= 299:
-                try:
-                    d = model.response_key
-                    if type(d) is list:
-                        data = [{**r} for r in d]
-                    else:
-                        data = response
-                except (KeyError, TypeError):
-                    if type(response) is list:
-                        data = [{**r} for r in response]
-                    elif type(response) is int:
-                        data = [response]
-                    else:
-                        data = {**response}
-
-                if type(data) is list:
-                    results.success.extend(data)
-                else:
-                    results.success.append(data)
-
-            elif status > 299:
-                try:
-                    results.failure.append({**response})
-                except TypeError:
-                    results.failure.append(response)
+        reverse = order == 'desc'
+
+        # Passing the model class (as older callers do) means no response_key.
+        process_one, response_key = self._process_one, model.response_key if isinstance(model, Record) else None
+        for result in results.responses[results.parsed:]:  # Responses make_request already parsed are skipped.
+            await process_one(results, result, response_key)
+
+        results.parsed = len(results.responses)
 
         if cleanup:
             del results.responses
-            results.success = [dict(sorted({k: v for k, v in rec.items() if v is not None}.items())) for rec in results.success]
-
-        if sort_order:
-            sort_order = sort_order.lower()
+            results.success = [{k: v for k in sorted(rec) if (v := rec[k]) is not None} for rec in results.success]
 
         if sort_field:
-            results.success.sort(key=lambda k: k[sort_field], reverse=True if sort_order == 'desc' else False)
+            results.success.sort(key=itemgetter(sort_field), reverse=reverse)
         elif sort_order:
-            results.success.sort(reverse=True if sort_order == 'desc' else False)
+            results.success.sort(reverse=reverse)
 
         return results
 
@@ -417,7 +713,7 @@ class BaseClientApi:
         Args:
             model (dataclass): Optionally defined:
                                - file (Optional[str]): A valid file-path
-                               - method (str): A valid HTTP Verb in [GET, POST]
+                               - method (str): A valid HTTP Verb in [DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT]
                                - end_point (str): REST Endpoint; e.g. /devices/query
                                - data (Optional[dct]):
                                - json (Optional[dct]):
@@ -428,52 +724,79 @@ class BaseClientApi:
             https://en.wikipedia.org/wiki/Hypertext_Transfer_Protocol#Request_methods
 
         Raises:
-            InvalidOptionError
             NotImplementedError
 
         Returns:
             (Optional[dict])"""
-        try:
-            base = self.cfg['URI']['Base']
-        except TypeError:
-            base = ''
+        if (method := (model.method or '').upper()) not in _METHODS:
+            logger.error(f'Unsupported HTTP method: {model.method}\n-> Valid Methods: {" | ".join(sorted(_METHODS))}')
+            raise NotImplementedError
 
         async with self.sem:
-            response = await self.session.request(auth=self.auth,
-                                                  # data=model.form_data,  # todo: implement this
-                                                  headers=model.headers or self.HDR,
-                                                  json=model.json_body,
-                                                  method=model.method,
-                                                  params=model.parameters,
-                                                  proxy=self.proxy,
-                                                  proxy_auth=self.proxy_auth,
-                                                  ssl=self.ssl,
-                                                  url=f'{base}{model.endpoint}')
-
-            # todo: change to template
-            if self.debug or debug:
-                print(f'auth: {self.auth}')
-                print(f'headers: {model.headers}')
-                print(f'json: {model.json_body}')
-                print(f'params: {model.parameters}')
-                print(f'proxy: {self.proxy}')
-                print(f'proxy_auth: {self.proxy_auth}')
-                print(await self.request_debug(response))
-
             try:
-                assert not response.status > 499
-            except AssertionError:
-                logger.error(self.request_debug(response))
+                response = await self.session.request(auth=self.auth,
+                                                      # data=model.form_data,  # todo: implement this
+                                                      headers=model.headers or self.HDR,
+                                                      json=model.json_body,
+                                                      method=method,
+                                                      params=model.parameters,
+                                                      proxy=self.proxy,
+                                                      proxy_auth=self.proxy_auth,
+                                                      url=self.uri_base + model.endpoint)
+            except aio.ClientError:
+                await self._breaker_failure()
+                raise
+
+            if self.debug or debug:
+                print(f'auth: {self.auth}\n'
+                      f'headers: {model.headers}\n'
+                      f'json: {model.json_body}\n'
+                      f'params: {model.parameters}\n'
+                      f'proxy: {self.proxy}\n'
+                      f'proxy_auth: {self.proxy_auth}'
+                      f'{await self.request_debug(response)}')
+
+            # The full request_debug dump is only rendered (and the body only read) in debug mode, above.
+            if response.status > 499:
+                logger.error(f'{response.method} {unquote_plus(str(response.url))} -> {response.status} {response.reason}')
+                response.release()
+                await self._breaker_failure()
                 raise aio.ClientError
 
+            await self._breaker_success()
+
             return response
 
+    async def _request_one(self, slot: Results, model: Record, response_key: Optional[str],
+                           debug: Optional[bool] = False) -> aio.ClientResponse:
+        """Request One
+
+        Makes a single request and parses its response into slot as soon as it arrives.
+
+        Args:
+            slot (Results): Receives this request's records
+            model (Record):
+            response_key (Optional[str]): see Record.response_key
+            debug (Optional[bool]):
+
+        Returns:
+            (aio.ClientResponse)"""
+        response = await self.request(model, debug=debug)
+        await self._process_one(slot, response, response_key)
+
+        return response
+
     async def make_request(self, models: List[Record], debug: Optional[bool] = False) -> Results:
         """Make Request
 
         This is a convenience method to make calling easier.
         It can be overridden to provide additional functionality.
 
+        Each response is parsed as soon as it arrives, overlapping parsing with the remaining requests.
+        results.responses, success and failure still follow the order of models, not completion order.
+        The parsed results are then passed through process_results (which does not parse them again),
+        so subclasses can post-process there. If any request fails, the others are cancelled.
+
         Args:
             models (List[Record]): If sending a list of models they must be all of the same type
             debug (bool):
@@ -483,9 +806,26 @@ class BaseClientApi:
         if type(models) is not list:
             models = [models]
 
-        results = await asyncio.gather(*[asyncio.create_task(self.request(m, debug=debug)) for m in models])
-        return await self.process_results(results=Results(responses=results), model=models[0].__class__)
+        response_key = models[0].response_key
+        slots = [Results(responses=None) for _ in models]
+        tasks = [asyncio.ensure_future(self._request_one(slot, m, response_key, debug)) for slot, m in zip(slots, models)]
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:  # Don't leave the remaining requests running (or their errors unretrieved).
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        results = Results(responses=responses)
+        for slot in slots:
+            results.success.extend(slot.success)
+            results.failure.extend(slot.failure)
+
+        results.parsed = len(responses)
 
+        return await self.process_results(results=results, model=models[0])
 
 if __name__ == '__main__':
     print(__doc__)
@@ -39,15 +39,13 @@ class InvalidOptionError(Exception):
         else:
             msg = str(self.message)
 
-        logger.error(f'Invalid Option for {vprint(self.var)}; should be one of:\n\t->{msg}')
+        msg = f'Invalid Option for {vprint(self.var, name="var")}; should be one of:\n\t->{msg}'
+        logger.error(msg)
 
-    def __repr__(self):
-        if type(self.message) is list:
-            msg = '\n'.join(self.message)
-        else:
-            msg = str(self.message)
+        return msg
 
-        logger.error(f'\nInvalid Option for {vprint(self.var)}; should be one of:\n\t->{msg}')
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.var!r}, {self.message!r})'
 
 
 if __name__ == '__main__':
@@ -17,9 +17,47 @@ copies or substantial portions of the Software.
 
 You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
+import json
+from typing import Any, Callable
+
+import orjson
+from base_client_api.models.results import json_loads
 from base_client_api.utils import pascal_case
 from pydantic import BaseModel as PydanticBaseModel
-from rapidjson import dumps, loads
+from pydantic.json import pydantic_encoder
+
+# Hand datetimes, dataclasses and builtin subclasses to pydantic's encoder, as json.dumps would.
+_ORJSON_PASSTHROUGH = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+
+def _orjson_dumps(v: Any, *, default: Callable[[Any], Any], **dumps_kwargs: Any) -> str:
+    """orjson Dumps
+
+    pydantic expects json_dumps to return str; orjson returns bytes.
+    indent=2 and sort_keys map to orjson options; anything orjson can't do (other json.dumps keywords,
+    other indents, integers beyond 64 bits) falls back to json.dumps, as does a model with custom
+    Config.json_encoders (default is then not pydantic_encoder).
+
+    Args:
+        v (Any):
+        default (Callable[[Any], Any]): pydantic's encoder for types orjson can't serialize
+        **dumps_kwargs (Any): json.dumps keywords passed through .json()
+
+    Returns:
+        (str)"""
+    indent = dumps_kwargs.get('indent')
+    if default is pydantic_encoder and dumps_kwargs.keys() <= {'indent', 'sort_keys'} and indent in (None, 2):
+        option = _ORJSON_PASSTHROUGH | (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if dumps_kwargs.get('sort_keys') else 0)
+        try:
+            return orjson.dumps(v, default=default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+
+    if indent is None:
+        dumps_kwargs.setdefault('separators', (',', ':'))  # Match orjson's compact output.
+    dumps_kwargs.setdefault('ensure_ascii', False)
+
+    return json.dumps(v, default=default, **dumps_kwargs)
 
 
 class Base(PydanticBaseModel):
@@ -35,5 +73,5 @@ class Base(PydanticBaseModel):
         alias_generator = pascal_case
         anystr_strip_whitespace = True
         case_sensitive = True
-        json_dumps = dumps
-        json_loads = loads
+        json_dumps = _orjson_dumps
+        json_loads = json_loads
@@ -141,7 +141,9 @@ class Record(Base):
 
     @property
     def json_body(self) -> Optional[dict]:
-        """Request Body"""
+        """Request Body
+
+        Rebuilt on every call so it always reflects the current body, including in-place changes."""
         if self.body:
             return self.body.dict()
 
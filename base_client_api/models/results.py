@@ -17,18 +17,78 @@ copies or substantial portions of the Software.
 
 You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
-from typing import Any, List, NoReturn
+import json
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, NoReturn, Union
 
-from pydantic import Field
-from pydantic.dataclasses import dataclass
+import orjson
+
+# 20+ consecutive digits; may be an integer beyond 64 bits, which orjson decodes as a float.
+_LONG_DIGITS = re.compile(rb'[0-9]{20}')
+_LONG_DIGITS_STR = re.compile(r'[0-9]{20}')
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """JSON Loads
+
+    orjson, except that documents that may hold integers beyond 64 bits are decoded with json.loads,
+    which keeps them as int.
+
+    Args:
+        data (Union[bytes, str]):
+
+    Returns:
+        (Any)"""
+    if (_LONG_DIGITS_STR if type(data) is str else _LONG_DIGITS).search(data) is None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+class LazyRecord(Mapping):
+    """Lazy Record
+
+    Read-only mapping over a raw JSON object body; decoded on first access."""
+    __slots__ = ('_raw', '_decoded')
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+        self._decoded = None
+
+    def materialize(self) -> dict:
+        """Materialize
+
+        Decodes (once) and returns the underlying record
+
+        Returns:
+            (dict)"""
+        if self._decoded is None:
+            self._decoded = json_loads(self._raw)
+
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self.materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.materialize() if self._decoded is not None else self._raw!r})'
 
 
 @dataclass
 class Results:
     """Results from aio.ClientRequest(s)"""
     responses: Any
-    success: List[dict] = Field(default_factory=list)
-    failure: List[dict] = Field(default_factory=list)
+    success: List[dict] = field(default_factory=list)
+    failure: List[dict] = field(default_factory=list)
+    parsed: int = field(default=0, repr=False, compare=False)  # Leading responses already in success/failure
 
     @property
     def dict(self) -> dict:
@@ -46,18 +106,12 @@ class Results:
         Removes keys that have a null value and optionally sorts
 
         Args:
-            sort_order ():
+            sort_order (str): ASC | DESC (any case)
 
         Returns:
             (NoReturn)"""
-        success = []
-        for rec in self.success:
-            d = {k: v for k, v in rec.items() if v is not None}
-            d = dict(sorted(d.items(), reverse=True if sort_order.lower() == 'desc' else False))
-            success.append(d)
-
-        self.success = success
-        del success
+        reverse = sort_order.lower() == 'desc'
+        self.success = [{k: v for k in sorted(rec, reverse=reverse) if (v := rec[k]) is not None} for rec in self.success]
 
 
 if __name__ == '__main__':
@@ -17,17 +17,45 @@ copies or substantial portions of the Software.
 
 You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
-import inspect
+import sys
+from functools import lru_cache
 from os.path import realpath
-from random import choice, shuffle
+from random import SystemRandom
 from string import ascii_letters, ascii_lowercase, ascii_uppercase, digits
-from typing import Any, Generator, List, NoReturn, Optional, Sized, Union
+from typing import Any, Generator, NoReturn, Optional, Sized, Tuple, Union
 
 from aiofiles import open
 from base_client_api.models.results import Results
 from devtools import debug
 from loguru import logger
-from rich import inspect, print
+from rich import print
+
+_PWD_SYMBOLS = '@#$'
+_PWD_CHARS = ascii_letters + digits + _PWD_SYMBOLS
+_CHUNK_SIZE = 256 * 1024  # Each aiofiles read is a thread-pool round trip; keep them few.
+
+
+_BANNER_TOP = ('\n▛', '▘', '▝', '▜')
+_BANNER_BOTTOM = ('▙', '▖', '▗', '▟\n')
+_BANNER_STYLES = {'top': _BANNER_TOP, 'above': _BANNER_TOP,
+                  'bottom': _BANNER_BOTTOM, 'bot': _BANNER_BOTTOM, 'below': _BANNER_BOTTOM}
+
+
+@lru_cache(maxsize=256)
+def _banner_frame(len_msg: int, location: Optional[str]) -> Tuple[str, str]:
+    """Banner Frame
+
+    Args:
+        len_msg (int): Length of the (already truncated) message
+        location (Optional[str]): see bprint
+
+    Returns:
+        (Tuple[str, str]): Text to the left and right of the message"""
+    left_border, left_pad, right_pad, right_border = _BANNER_STYLES.get(location, ('▌', ' ', ' ', '▐'))
+    len_banner = 132 - len_msg
+    hlf0 = len_banner >> 1
+
+    return f'{left_border}{left_pad * hlf0} ', f' {right_pad * (len_banner - hlf0)}{right_border}'
 
 
 def bprint(message: str, location: str = None) -> NoReturn:
@@ -39,29 +67,11 @@ def bprint(message: str, location: str = None) -> NoReturn:
 
     Returns:
         msg (str)"""
-    len_msg = len(message)
-    if len_msg > 126:
-        m = list(message)
-        message = f'{"".join(m[:123])}...'
-
-    len_banner = 132 - len_msg
-    half = int(len_banner / 2)
-
-    if len_banner % 2 == 0:
-        hlf0, hlf1 = half, half
-    else:
-        hlf0, hlf1 = half, half + 1
+    if len(message) > 126:
+        message = f'{message[:123]}...'
 
-    if location in ['top', 'above']:
-        msg = f'\n▛{"▘" * hlf0} {message} {"▝" * hlf1}▜'
-    elif location in ['bottom', 'bot', 'below']:
-        msg = f'▙{"▖" * hlf0} {message} {"▗" * hlf1}▟\n'
-    else:
-        msg = f'▌{" " * hlf0} {message} {" " * hlf1}▐'
-
-    print(msg)
-
-    return
+    left, right = _banner_frame(len(message), location)
+    sys.stdout.write(f'{left}{message}{right}\n')  # Plain text; rich would parse [..] in message as markup.
 
 
 def flatten(itr: Union[tuple, list]) -> Generator:
@@ -72,38 +82,49 @@ def flatten(itr: Union[tuple, list]) -> Generator:
 
     Returns:
         (Generator)"""
-    for item in itr:
-        if isinstance(item, (tuple, list)):
-            yield from flatten(item)
-        else:
+    stack = [iter(itr)]  # Explicit stack instead of recursion; no frame per level or recursion limit.
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, (tuple, list)):
+                stack.append(iter(item))
+                break
+
             yield item
+        else:
+            stack.pop()
 
 
 def generate_password(min_len=15, max_length=24) -> str:
     """Generate a Password
 
+    Always contains at least one upper case letter, lower case letter, digit and symbol (@#$);
+    drawn from the OS CSPRNG.
+
     Args:
         min_len (int): 15
-        max_length (int): 24
+        max_length (int): 24 (exclusive)
 
     Returns:
         pwd (str)"""
-    chars = list(flatten(['@', '#', '$', list(ascii_letters), list(digits)]))
-    shuffle(chars)
-    length = choice(range(min_len, max_length))
+    rng = SystemRandom()
+    length = rng.randint(min_len, max_length - 1)
+
+    pwd = [rng.choice(ascii_uppercase), rng.choice(ascii_lowercase), rng.choice(digits), rng.choice(_PWD_SYMBOLS)]
+    pwd.extend(rng.choices(_PWD_CHARS, k=length - len(pwd)))
+    rng.shuffle(pwd)
+
+    return ''.join(pwd)
+
 
-    pwd = list(f'{choice(ascii_uppercase)}{choice(ascii_lowercase)}{choice(digits)}{choice(["@", "#", "$"])}')
-    pwd.extend([choice(chars) for _ in range((length - len(pwd)))])
-    shuffle(pwd)
-    pwd = ''.join(pwd)
+def _plural(n: int) -> str:
+    """Plural Suffix
 
-    # Just to be sure the password meets requirements
-    assert not length - len(pwd)  # Password is of desired length
-    assert any(pwd) in ['@', '#', '$']
-    assert any(pwd) in ascii_letters
-    assert any(pwd) in digits
+    Args:
+        n (int): Count of the thing being described
 
-    return pwd
+    Returns:
+        (str): 's' unless n is 1"""
+    return '' if n == 1 else 's'
 
 
 def tprint(results: Results, requests: Optional[Any] = None, top: Optional[int] = None) -> NoReturn:
@@ -117,37 +138,27 @@ def tprint(results: Results, requests: Optional[Any] = None, top: Optional[int]
     Returns:
         (NoReturn)"""
     # todo: if no text response received, return response status in response.failure instead of ''
-    top_hdr = f'Top {top} ' if top else '1'
+    top_hdr = f'Top {top} ' if top else ''
+    n_success, n_failure = len(results.success), len(results.failure)
 
-    print(
-        f'\n{top_hdr if len(results.success) > 1 else ""}[bold green]Success Result{"s" if len(results.success) > 1 else ""}['
-        f'/bold green] of {len(results.success)} Returned:')
-    if top:
-        debug(results.success[:top])
-    else:
-        debug(results.success)
+    print(f'\n{top_hdr if n_success > 1 else ""}[bold green]Success Result{_plural(n_success)}'
+          f'[/bold green] of {n_success} Returned:')
+    success = results.success[:top] if top else results.success
+    debug(success)
 
-    print(f'\n{top_hdr if len(results.failure) > 1 else ""}[bold red]Failure Result{"s" if len(results.failure) > 1 else ""}'
-          f'[/bold red] of {len(results.failure)} Returned:')
-
-    if top:
-        debug(results.failure[:top])
-    else:
-        debug(results.failure)
+    print(f'\n{top_hdr if n_failure > 1 else ""}[bold red]Failure Result{_plural(n_failure)}'
+          f'[/bold red] of {n_failure} Returned:')
+    failure = results.failure[:top] if top else results.failure
+    debug(failure)
 
     if requests:
-        print(f'\n{top_hdr}Requests Result{"s" if len(results.success) > 1 else ""}: {len(requests)}')
-
-        if top:
-            debug(requests[:top])
-        else:
-            debug(requests)
-
-    return
+        print(f'\n{top_hdr}Requests Result{_plural(len(requests))}: {len(requests)}')
+        requests = requests[:top] if top else requests
+        debug(requests)
 
 
 # todo: This needs testing (errors) when trying classes
-def vprint(var: Sized, str_output: bool = True) -> Optional[str]:
+def vprint(var: Sized, str_output: bool = True, name: Optional[str] = None) -> Optional[str]:
     """Variable Printer
        - Prints the name of the variable, length, and value.
        -- [<variable_name>] (<variable_length>): <variable_content>
@@ -157,37 +168,34 @@ def vprint(var: Sized, str_output: bool = True) -> Optional[str]:
     Args:
         var (object)
         str_output (bool): If false will print instead of returning a string
+        name (Optional[str]): Variable name; if omitted it is looked up in the caller's locals (slower)
 
     Returns:
         output (str)"""
-    callers_local_vars = inspect.currentframe().f_back.f_locals.items()
-
-    for var_name, var_val in callers_local_vars:
-        if var_val is var:
-            t = str(type(var))
-            typ = t[t.index("'") + 1:-2]
-
-            try:
-                length = len(var)
-            except TypeError:
-                length = 'N/A'
-
-            if t is list:
-                output = f'{var_name}: {typ} = ({length}):'
-                output += [f'\t{i}' for i in var_val]
-            elif t is dict:
-                output = f'{var_name}: {typ} = ({length}):'
-                output += [f'\t{k}: {v}' for k, v in var_val.items()]
-            else:
-                output = f'{var_name}: {typ} = ({length}) {var_val}'
-
-            if str_output:
-                return output
-            else:
-                print(output)
-                return
-        else:
-            logger.error('var_val is not var')
+    if name is None:
+        name = next((k for k, v in sys._getframe(1).f_locals.items() if v is var), None)
+        if name is None:
+            logger.error('var not found in caller locals')
+            return None
+
+    typ = type(var)
+    try:
+        length = len(var)
+    except TypeError:
+        length = 'N/A'
+
+    output = f'{name}: {typ.__name__} = ({length})'
+    if typ is list:
+        output = '\n'.join([f'{output}:', *(f'\t{i}' for i in var)])
+    elif typ is dict:
+        output = '\n'.join([f'{output}:', *(f'\t{k}: {v}' for k, v in var.items())])
+    else:
+        output = f'{output} {var}'
+
+    if str_output:
+        return output
+
+    print(output)
 
 
 def sort_dict(dct: dict, reverse: Optional[bool] = False) -> dict:
@@ -199,31 +207,27 @@ def sort_dict(dct: dict, reverse: Optional[bool] = False) -> dict:
 
     Returns:
         (dict)"""
-    items: List[List[dict]] = [[k, v] for k, v in sorted(dct.items(), key=lambda x: x[0], reverse=reverse)]
-
-    for item in items:
-        if isinstance(item[1], dict):
-            item[1] = sort_dict(item[1], reverse=reverse)
+    return {k: sort_dict(v, reverse=reverse) if isinstance(v := dct[k], dict) else v for k in sorted(dct, reverse=reverse)}
 
-    return dict(items)
 
-
-async def file_streamer(file_path: str) -> bytes:
+async def file_streamer(file_path: str, chunk_size: int = _CHUNK_SIZE) -> bytes:
     """File Streamer
 
     Streams a file from disk.
 
     Args:
         file_path (str):
+        chunk_size (int): Bytes per read; default 256 KiB
 
     Returns:
         chunk (bytes)"""
     async with open(realpath(file_path), 'rb') as f:
-        while chunk := await f.read(1024):
+        while chunk := await f.read(chunk_size):
             yield chunk
 
 
-def pascal_case(value) -> str:
+@lru_cache(maxsize=512)
+def pascal_case(value: str) -> str:
     """Convert Case
 
     Converts snake case to pascal case for JSON
@@ -239,11 +243,12 @@ def pascal_case(value) -> str:
 
     Returns:
         (str)"""
-    words = value.split('_')
-    new_words = [words[0]]
-    [new_words.append(x.capitalize()) for x in words[1:]]
+    if '_' not in value:  # Single word; nothing to convert.
+        return value
+
+    head, *tail = value.split('_')
 
-    return ''.join(new_words)
+    return head + ''.join(w.capitalize() for w in tail)
 
 
 if __name__ == '__main__':
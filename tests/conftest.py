@@ -0,0 +1,107 @@
+#!/usr/bin/env python3.8
+"""Base Client API -> Test Fixtures
+Copyright © 2019-2021 Jerod Gawne <https://github.com/jerodg/>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the Server Side Public License (SSPL) as
+published by MongoDB, Inc., either version 1 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+SSPL for more details.
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+You should have received a copy of the SSPL along with this program.
+If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
+import asyncio
+from os.path import realpath
+
+import orjson
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from base_client_api.base_client import BaseClientApi
+
+try:
+    import uvloop  # Optional extra; poetry install -E uvloop
+except ImportError:
+    uvloop = None
+
+
+def pytest_addoption(parser):
+    """--integration opts in to the live network tests (marked integration)."""
+    parser.addoption('--integration', action='store_true', default=False, help='run the live network tests')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the live network tests unless --integration is given; the rest of the suite runs offline."""
+    if config.getoption('--integration'):
+        return
+
+    skip = pytest.mark.skip(reason='live network test; run with --integration')
+    for item in items:
+        if 'integration' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope='module')
+def event_loop():
+    """One event loop per test module, so module-scoped async fixtures can share it; uvloop when installed."""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope='module')
+async def bca():
+    """Client shared by the tests in a module; pooled connections (keep-alive, DNS cache) are reused between them."""
+    # A short timeout keeps a stalled remote from holding up the suite.
+    async with BaseClientApi(cfg=[realpath('./examples/config.toml'), {'Options': {'Timeout': 30}}]) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def local_api():
+    """Local stand-in for the Open Library lists search; yields its base URI (no trailing /)."""
+    async def search_lists(request: web.Request) -> web.Response:
+        offset, limit = int(request.query.get('offset', 0)), int(request.query.get('limit', 5))
+
+        return web.json_response({'start': offset,
+                                  'docs': [{'name': f'List {i}', 'seed_count': None} for i in range(offset, offset + limit)]})
+
+    async def search_lists_array(request: web.Request) -> web.Response:
+        response = await search_lists(request)
+
+        return web.json_response(orjson.loads(response.body)['docs'])  # Top-level JSON array
+
+    async def search_lists_slow(request: web.Request) -> web.Response:
+        await asyncio.sleep(float(request.query.get('delay', 2)))
+
+        return await search_lists(request)
+
+    hits = 0
+
+    async def search_lists_flaky(request: web.Request) -> web.Response:
+        nonlocal hits
+        hits += 1
+        if hits <= int(request.query.get('failures', 0)):  # Counted across all requests to this route
+            return web.Response(status=503)
+
+        return await search_lists(request)
+
+    app = web.Application()
+    app.router.add_get('/search/lists.json', search_lists)
+    app.router.add_get('/slow/search/lists.json', search_lists_slow)
+    app.router.add_get('/flaky/search/lists.json', search_lists_flaky)
+    app.router.add_get('/array/search/lists.json', search_lists_array)
+
+    server = TestServer(app, host='127.0.0.1')
+    await server.start_server()
+    yield str(server.make_url('')).rstrip('/')
+    await server.close()
@@ -19,6 +19,8 @@ You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
 from typing import Optional
 
+from pydantic import PrivateAttr
+
 from base_client_api.models.record import Record
 
 
@@ -27,6 +29,7 @@ class BooksListAll(Record):
     q: str
     limit: Optional[int]
     offset: Optional[int]
+    _parameters: Optional[dict] = PrivateAttr(None)
 
     @property
     def method(self) -> str:
@@ -45,9 +48,15 @@ class BooksListAll(Record):
 
         If you need to pass parameters in the URL
 
+        Built on first access and reused (URL, retries, debug output); these requests are not changed
+        after construction.
+
         Returns:
             (dict)"""
-        return self.dict()
+        if self._parameters is None:
+            self._parameters = self.dict()
+
+        return self._parameters
 
     @property
     def headers(self) -> Optional[dict]:
@@ -83,3 +92,102 @@ class BooksListAll(Record):
         Returns:
             (Union[str, None])"""
         return 'docs'
+
+
+class BooksListLocal(BooksListAll):
+    """Books -> List All (Local)
+
+    Same request with a relative endpoint, for the local_api test fixture"""
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint
+
+        The suffix end of the URI
+
+        Returns:
+            (str)"""
+        return '/search/lists.json'
+
+
+class BooksListSlow(BooksListLocal):
+    """Books -> List All (Slow)
+
+    Local endpoint that answers after a delay"""
+    delay: float = 2  # Seconds
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint
+
+        The suffix end of the URI
+
+        Returns:
+            (str)"""
+        return '/slow/search/lists.json'
+
+
+class BooksListFlaky(BooksListLocal):
+    """Books -> List All (Flaky)
+
+    Local endpoint that answers 503 to its first requests"""
+    failures: int = 0  # Across all requests to the endpoint
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint
+
+        The suffix end of the URI
+
+        Returns:
+            (str)"""
+        return '/flaky/search/lists.json'
+
+
+class BooksListRaw(BooksListLocal):
+    """Books -> List All (Raw)
+
+    Whole response body as the record; no response_key"""
+
+    @property
+    def response_key(self) -> Optional[str]:
+        """Data Key
+
+        This is the key used in the return dict that holds the primary responses
+
+        Returns:
+            (Union[str, None])"""
+        return None
+
+
+class BooksListArray(BooksListRaw):
+    """Books -> List All (Array)
+
+    Local endpoint that answers with a top-level JSON array of the lists"""
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint
+
+        The suffix end of the URI
+
+        Returns:
+            (str)"""
+        return '/array/search/lists.json'
+
+
+class BooksListInvalid(BooksListLocal):
+    """Books -> List All (Invalid)
+
+    Fails in request() before anything is sent"""
+
+    @property
+    def method(self) -> str:
+        """Method
+
+        The HTTP verb to be used
+         - Must be a valid HTTP verb as listed above in METHODS
+
+        Returns:
+            (str)"""
+        return 'BOGUS'
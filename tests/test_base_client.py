@@ -17,44 +17,303 @@ copies or substantial portions of the Software.
 
 You should have received a copy of the SSPL along with this program.
 If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
+import asyncio
 import time
 from os.path import realpath
+from typing import NoReturn
 
+import aiohttp as aio
 import pytest
+from tenacity import RetryError, wait_none
 
-from base_client_api.base_client import BaseClientApi
-from base_client_api.models.results import Results
+from base_client_api.base_client import BaseClientApi, refresh_env_cache
+from base_client_api.models.results import LazyRecord, Results
 from base_client_api.utils import bprint, tprint
-from .models.reqs import BooksListAll
+from .models.reqs import (BooksListAll, BooksListArray, BooksListFlaky, BooksListInvalid, BooksListLocal, BooksListRaw,
+                          BooksListSlow)
 
 
+def _skip_if_offline(re: RetryError) -> NoReturn:
+    """Skips the test if the retries ended on a DNS/connect failure; anything else (e.g. 5xx) is re-raised."""
+    if isinstance(re.last_attempt.exception(), aio.ClientConnectorError):
+        pytest.skip('Network unavailable')
+
+    raise re
+
+
+@pytest.mark.integration
 @pytest.mark.asyncio
-async def test_make_request():
-    ts = time.perf_counter()
+async def test_make_request(bca):
     bprint('Test: Make Request/Process Results', 'top')
+    ts = time.perf_counter()
 
-    async with BaseClientApi(cfg=realpath('./examples/config.toml')) as bca:
-        results = await bca.make_request(BooksListAll(q='book',
-                                                      limit=25,
-                                                      offset=0))
+    # Five pages requested concurrently through the shared session.
+    try:
+        results = await bca.make_request([BooksListAll(q='book', limit=5, offset=offset) for offset in range(0, 25, 5)])
+    except RetryError as re:
+        _skip_if_offline(re)
 
-        assert type(results) is Results
-        assert results.success is not None
-        assert not results.failure
+    assert type(results) is Results
+    assert len(results.responses) == 5
+    assert results.success is not None
+    assert not results.failure
 
-        tprint(results, top=5)
+    tprint(results, top=5)
 
     bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
 
 
+@pytest.mark.integration
 @pytest.mark.asyncio
-async def test_request_debug():
-    ts = time.perf_counter()
+async def test_request_debug(bca):
     bprint('Test: Request Debug', 'top')
+    ts = time.perf_counter()
 
-    async with BaseClientApi() as bca:
+    try:
         await bca.make_request(BooksListAll(q='book',
-                                            limit=25,
+                                            limit=1,  # request_debug only needs a small JSON body to render
                                             offset=0), debug=True)
+    except RetryError as re:
+        _skip_if_offline(re)
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_request_debug_local(local_api, capsys):
+    bprint('Test: Request Debug (Local)', 'top')
+    ts = time.perf_counter()
+
+    async with BaseClientApi(cfg={'URI': {'Base': local_api}}) as bca:
+        results = await bca.make_request(BooksListLocal(q='book', limit=5, offset=10), debug=True)
+
+    assert [rec['name'] for rec in results.success] == [f'List {i}' for i in range(10, 15)]
+    assert not results.failure
+    assert 'Request-URL' in capsys.readouterr().out
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_make_request_cancels_on_failure(local_api):
+    bprint('Test: Make Request Cancels on Failure', 'top')
+    ts = time.perf_counter()
+
+    async with BaseClientApi(cfg={'URI': {'Base': local_api}}) as bca:
+        with pytest.raises(NotImplementedError):
+            await bca.make_request([BooksListSlow(q='book', limit=1),
+                                    BooksListSlow(q='book', limit=1),
+                                    BooksListInvalid(q='book', limit=1)])
+
+        assert bca.sem.active == 0  # The slow requests were cancelled, not left holding their slots
+        assert time.perf_counter() - ts < 1
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_make_request_order(local_api):
+    bprint('Test: Make Request Order', 'top')
+    ts = time.perf_counter()
+
+    async with BaseClientApi(cfg={'URI': {'Base': local_api}}) as bca:
+        # The first request answers last; results still follow the order of the models.
+        models = [BooksListSlow(q='book', limit=2, offset=0, delay=0.2), BooksListLocal(q='book', limit=2, offset=2)]
+        results = await bca.make_request(models)
+
+        assert [rec['name'] for rec in results.success] == [f'List {i}' for i in range(4)]
+        assert [r.url.path for r in results.responses] == [m.endpoint for m in models]
+
+        # Already parsed responses are not parsed (and their records not added) again.
+        results = await bca.process_results(results, models[0], cleanup=True, sort_field='name', sort_order='desc')
+        assert [rec['name'] for rec in results.success] == [f'List {i}' for i in range(3, -1, -1)]
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_process_results(local_api):
+    bprint('Test: Process Results', 'top')
+    ts = time.perf_counter()
+
+    async with BaseClientApi(cfg={'URI': {'Base': local_api}}) as bca:
+        model = BooksListLocal(q='book', limit=3, offset=0)
+        results = await bca.make_request(model)
+
+        with pytest.raises(ValueError):  # Only ASC | DESC (any case)
+            await bca.process_results(results, model, sort_field='name', sort_order='ascending')
+
+        results = await bca.process_results(results, model, cleanup=True, sort_field='name', sort_order='DESC')
+        assert results.success == [{'name': 'List 2'}, {'name': 'List 1'}, {'name': 'List 0'}]  # None values removed
+        assert not hasattr(results, 'responses')
+
+        raw = BooksListRaw(q='book', limit=1, offset=0)
+        results = await bca.process_results(await bca.make_request(raw), raw, cleanup=True)
+        assert [list(rec) for rec in results.success] == [['docs', 'start']]  # Keys sorted
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_env_overrides(monkeypatch):
+    bprint('Test: Environment Overrides', 'top')
+    ts = time.perf_counter()
+
+    monkeypatch.setenv('URI_Base', 'https://env.example.com')
+    monkeypatch.setenv('Options_SEM', '3')
+    monkeypatch.setenv('Options_VerifySSL', 'false')
+    refresh_env_cache()
+
+    try:
+        async with BaseClientApi(cfg={'URI': {'Base': 'https://cfg.example.com'}}) as bca:
+            assert bca.cfg['URI']['Base'] == 'https://env.example.com'
+            assert bca.cfg['Options']['SEM'] == 3
+            assert bca.cfg['Options']['VerifySSL'] is False
+
+        monkeypatch.delenv('URI_Base')
+        async with BaseClientApi(cfg={'URI': {'Base': 'https://cfg.example.com'}}) as bca:
+            assert bca.cfg['URI']['Base'] == 'https://env.example.com'  # Snapshot is cached until refreshed
+
+        refresh_env_cache()
+        async with BaseClientApi(cfg={'URI': {'Base': 'https://cfg.example.com'}}) as bca:
+            assert bca.cfg['URI']['Base'] == 'https://cfg.example.com'
+    finally:
+        monkeypatch.undo()
+        refresh_env_cache()
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_load_config_list(tmp_path):
+    bprint('Test: Load Config List', 'top')
+    ts = time.perf_counter()
+
+    cfg_json = tmp_path / 'config.json'
+    cfg_json.write_text('{"URI": {"Base": "https://json.example.com"}, "Options": {"SEM": 7}}')
+
+    async with BaseClientApi(cfg=[realpath('./examples/config.toml'),
+                                  str(cfg_json),
+                                  {'Options': {'Debug': True}}]) as bca:
+        assert bca.cfg['URI']['Base'] == 'https://json.example.com'
+        assert bca.cfg['Options']['SEM'] == 7
+        assert bca.cfg['Options']['Debug'] is True
+        assert bca.cfg['Options']['CookieJar_Unsafe'] is False  # Untouched keys from earlier sources survive
+        assert bca.debug
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_config_file_cache(tmp_path):
+    bprint('Test: Config File Cache', 'top')
+    ts = time.perf_counter()
+
+    cfg_toml = tmp_path / 'config.toml'
+    cfg_toml.write_text('[URI]\nBase = "https://one.example.com"\n')
+
+    async with BaseClientApi(cfg=str(cfg_toml)) as bca:
+        bca.cfg['URI']['Base'] = 'https://mutated.example.com'  # Must not leak into the cache
+
+    async with BaseClientApi(cfg=str(cfg_toml)) as bca:
+        assert bca.cfg['URI']['Base'] == 'https://one.example.com'
+
+    cfg_toml.write_text('[URI]\nBase = "https://two.example.com/"\n')  # New size -> new cache key
+
+    async with BaseClientApi(cfg=str(cfg_toml)) as bca:
+        assert bca.cfg['URI']['Base'] == 'https://two.example.com/'
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_set_concurrency():
+    bprint('Test: Set Concurrency', 'top')
+    ts = time.perf_counter()
+
+    async with BaseClientApi(cfg={'Options': {'SEM': 4}}) as bca:
+        assert bca.sem.limit == 4
+
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with bca.sem:
+                peak = max(peak, bca.sem.active)
+                await asyncio.sleep(0.01)
+
+        await bca.set_concurrency(2)
+        await asyncio.gather(*[work() for _ in range(10)])
+        assert peak == 2
+        assert bca.sem.active == 0
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+class _BreakerClient(BaseClientApi):
+    """Records the concurrency limit after every breaker update"""
+    BREAKER_THRESHOLD = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limits = []
+
+    async def _breaker_failure(self):
+        await super()._breaker_failure()
+        self.limits.append(self.sem.limit)
+
+    async def _breaker_success(self):
+        await super()._breaker_success()
+        self.limits.append(self.sem.limit)
+
+
+@pytest.mark.asyncio
+async def test_breaker(local_api, monkeypatch):
+    bprint('Test: Breaker', 'top')
+    ts = time.perf_counter()
+
+    monkeypatch.setattr(BaseClientApi.request.retry, 'wait', wait_none())  # Retry immediately
+
+    async with _BreakerClient(cfg={'URI': {'Base': local_api}, 'Options': {'SEM': 8}}) as bca:
+        # Four 503s halve the limit after every BREAKER_THRESHOLD of them; the 5th attempt succeeds.
+        results = await bca.make_request(BooksListFlaky(q='book', limit=1, offset=0, failures=4))
+        assert results.success == [{'name': 'List 0', 'seed_count': None}]
+        assert bca.limits == [8, 4, 4, 2, 4]
+
+        # Each success doubles it again, up to the configured SEM.
+        await bca.make_request(BooksListFlaky(q='book', limit=1, offset=0))
+        await bca.make_request(BooksListFlaky(q='book', limit=1, offset=0))
+        assert bca.limits == [8, 4, 4, 2, 4, 8, 8]
+        assert bca.sem.active == 0
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
+
+
+@pytest.mark.asyncio
+async def test_lazy_decode(local_api):
+    bprint('Test: Lazy Decode', 'top')
+    ts = time.perf_counter()
+
+    async with BaseClientApi(cfg={'URI': {'Base': local_api}}) as bca:
+        bca.LAZY_DECODE = True
+
+        # JSON objects are kept as raw bytes until a key is read.
+        models = [BooksListRaw(q='book', limit=1, offset=5), BooksListRaw(q='book', limit=1, offset=0)]
+        results = await bca.make_request(models)
+        assert all(type(rec) is LazyRecord for rec in results.success)
+        assert results.success[0]['start'] == 5
+        assert results.success[1].materialize() == {'start': 0, 'docs': [{'name': 'List 0', 'seed_count': None}]}
+
+        results = await bca.process_results(results, models[0], sort_field='start')
+        assert [rec['start'] for rec in results.success] == [0, 5]
+        assert all(type(rec) is LazyRecord for rec in results.success)
+
+        results = await bca.process_results(results, models[0], cleanup=True, sort_field='start', sort_order='desc')
+        assert results.success == [{'docs': [{'name': 'List 5', 'seed_count': None}], 'start': 5},
+                                   {'docs': [{'name': 'List 0', 'seed_count': None}], 'start': 0}]
+
+        # JSON arrays are still split into records, decoded eagerly.
+        results = await bca.make_request(BooksListArray(q='book', limit=2, offset=0))
+        assert results.success == [{'name': 'List 0', 'seed_count': None}, {'name': 'List 1', 'seed_count': None}]
 
     bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', 'bottom')
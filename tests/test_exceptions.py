@@ -0,0 +1,38 @@
+#!/usr/bin/env python3.8
+"""Base Client API -> Test Exceptions
+Copyright © 2019-2021 Jerod Gawne <https://github.com/jerodg/>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the Server Side Public License (SSPL) as
+published by MongoDB, Inc., either version 1 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+SSPL for more details.
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+You should have received a copy of the SSPL along with this program.
+If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
+import time
+
+from base_client_api.exceptions import InvalidOptionError
+from base_client_api.utils import bprint
+
+
+def test_invalid_option_error():
+    bprint('Test: Invalid Option Error', location='top')
+    ts = time.perf_counter()
+
+    err = InvalidOptionError('x', ['a', 'b'])
+    assert str(err) == 'Invalid Option for var: str = (1) x; should be one of:\n\t->a\nb'
+    assert repr(err) == "InvalidOptionError('x', ['a', 'b'])"
+
+    err = InvalidOptionError(3, 'a | b')
+    assert str(err) == 'Invalid Option for var: int = (N/A) 3; should be one of:\n\t->a | b'
+    assert repr(err) == "InvalidOptionError(3, 'a | b')"
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3.8
+"""Base Client API -> Test Models
+Copyright © 2019-2021 Jerod Gawne <https://github.com/jerodg/>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the Server Side Public License (SSPL) as
+published by MongoDB, Inc., either version 1 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+SSPL for more details.
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+You should have received a copy of the SSPL along with this program.
+If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from base_client_api.base_client import _json_dumps
+from base_client_api.models.base import Base
+from base_client_api.models.record import Record
+from base_client_api.models.results import json_loads, LazyRecord
+from base_client_api.utils import bprint
+
+
+class Sample(Base):
+    """Sample Model"""
+    client_id: int
+    names: Optional[List[str]]
+
+
+class SampleEncoded(Base):
+    """Sample Model (Custom Encoder)"""
+    ts: datetime
+
+    class Config:
+        """Config
+
+        Pydantic configuration"""
+        json_encoders = {datetime: lambda v: int(v.timestamp())}
+
+
+def test_base_json():
+    bprint('Test: Base JSON', location='top')
+    ts = time.perf_counter()
+
+    assert Sample(client_id=1, names=['a']).json() == '{"client_id":1,"names":["a"]}'
+    assert Sample(client_id=2 ** 70).json() == '{"client_id":1180591620717411303424,"names":null}'  # Beyond 64 bits
+    assert Sample(client_id=1, names=['a']).json(indent=2) == '{\n  "client_id": 1,\n  "names": [\n    "a"\n  ]\n}'
+    assert Sample(client_id=1).json(by_alias=True, sort_keys=True) == '{"clientId":1,"names":null}'
+    assert Sample(client_id=1).json(indent=4).startswith('{\n    "client_id"')
+
+    when = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert SampleEncoded(ts=when).json() == '{"ts":1577836800}'  # Config.json_encoders is honoured
+    assert Base.construct(ts=when).json() == '{"ts":"2020-01-01T00:00:00+00:00"}'
+
+    sample = Sample.parse_raw(b'{"clientId": 3, "names": ["b"]}')
+    assert sample.client_id == 3
+    assert sample.names == ['b']
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
+
+
+def test_record_json_body():
+    bprint('Test: Record JSON Body', location='top')
+    ts = time.perf_counter()
+
+    record = Record(body=Sample(client_id=1, names=['a']))
+    body = record.json_body
+    assert body == {'client_id': 1, 'names': ['a']}
+
+    body['names'].append('b')  # The caller's dict is its own
+    assert record.json_body == {'client_id': 1, 'names': ['a']}
+
+    record.body.names.append('c')  # In-place changes are picked up
+    assert record.json_body == {'client_id': 1, 'names': ['a', 'c']}
+
+    record.body = Sample(client_id=2)
+    assert record.json_body == {'client_id': 2, 'names': None}
+    assert record.copy(update={'body': Sample(client_id=3)}).json_body == {'client_id': 3, 'names': None}
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
+
+
+def test_json_big_ints():
+    bprint('Test: JSON Big Integers', location='top')
+    ts = time.perf_counter()
+
+    big = 123456789012345678901234567890
+    raw = b'{"clientId": 123456789012345678901234567890, "names": ["12345678901234567890123"]}'
+
+    assert json_loads(raw) == {'clientId': big, 'names': ['12345678901234567890123']}  # int, not float
+    assert json_loads(raw.decode('utf-8'))['clientId'] == big
+    assert json_loads(b'{"clientId": 1}') == {'clientId': 1}
+    assert LazyRecord(raw)['clientId'] == big
+    assert Sample.parse_raw(raw).client_id == big
+    assert _json_dumps({'id': big}) == '{"id":123456789012345678901234567890}'
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
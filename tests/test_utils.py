@@ -20,37 +20,93 @@ If not, see <https://www.mongodb.com/licensing/server-side-public-license>."""
 import time
 
 import pytest
-from rich import print
 
-from base_client_api.utils import bprint, pascal_case
+from base_client_api.utils import bprint, flatten, generate_password, pascal_case, sort_dict, vprint
 
 
-@pytest.mark.asyncio
-async def test_banner_print():
+def test_banner_print():
     ts = time.perf_counter()
     bprint('Test: Top Print', location='top')
     bprint('Test: Center Print')
     bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
 
 
-@pytest.mark.asyncio
-async def test_pascal_case():
-    ts = time.perf_counter()
+@pytest.mark.parametrize('source, expected', [('body', 'body'),
+                                              ('client_id', 'clientId'),
+                                              ('activation_code_validity', 'activationCodeValidity')])
+def test_pascal_case(source, expected):
     bprint('Test: Pascal Case', location='top')
+    ts = time.perf_counter()
 
-    source = 'body'
     result = pascal_case(source)
     print(f'From: {source} \n  To: {result}')
-    assert result == 'body'
+    assert result == expected
 
-    source = 'client_id'
-    result = pascal_case(source)
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
+
+
+def test_flatten():
+    bprint('Test: Flatten', location='top')
+    ts = time.perf_counter()
+
+    source = [1, [2, (3, [4, []]), ()], 'ab', ([5],), [[[6]]], 7]
+    result = list(flatten(source))
     print(f'From: {source} \n  To: {result}')
-    assert result == 'clientId'
+    assert result == [1, 2, 3, 4, 'ab', 5, 6, 7]  # Depth-first, in order; strings are not split
+    assert list(flatten(([], ((),)))) == []
+    assert list(flatten((1, 2))) == [1, 2]
 
-    source = 'activation_code_validity'
-    result = pascal_case(source)
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
+
+
+def test_sort_dict():
+    bprint('Test: Sort Dict', location='top')
+    ts = time.perf_counter()
+
+    source = {'b': 1, 'a': {'d': 2, 'c': [{'z': 0, 'y': 1}]}}
+    result = sort_dict(source)
     print(f'From: {source} \n  To: {result}')
-    assert result == 'activationCodeValidity'
+    assert list(result) == ['a', 'b']
+    assert list(result['a']) == ['c', 'd']
+
+    result = sort_dict(source, reverse=True)
+    assert list(result) == ['b', 'a']
+    assert list(result['a']) == ['d', 'c']
+
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
+
+
+def test_generate_password():
+    bprint('Test: Generate Password', location='top')
+    ts = time.perf_counter()
+
+    for _ in range(100):
+        pwd = generate_password()
+        assert 15 <= len(pwd) < 24
+        assert any(c in '@#$' for c in pwd)
+        assert any(c.isupper() for c in pwd)
+        assert any(c.islower() for c in pwd)
+        assert any(c.isdigit() for c in pwd)
+
+    assert len(generate_password(min_len=8, max_length=9)) == 8  # max_length is exclusive
+    print(f'Password: {pwd}')
+    bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')
+
+
+def test_vprint(capsys):
+    bprint('Test: Variable Print', location='top')
+    ts = time.perf_counter()
+
+    names = ['a', 'b']
+    ages = {'a': 1}
+    assert vprint(names) == 'names: list = (2):\n\ta\n\tb'  # Name looked up in the caller's locals
+    assert vprint(ages) == 'ages: dict = (1):\n\ta: 1'
+    assert vprint(3, name='count') == 'count: int = (N/A) 3'
+    output = vprint(object())  # Not a local of the caller; called outside assert, whose rewrite adds locals
+    assert output is None
+
+    capsys.readouterr()
+    assert vprint(names, str_output=False) is None
+    assert capsys.readouterr().out.split() == ['names:', 'list', '=', '(2):', 'a', 'b']  # rich expands the tabs
 
     bprint(f'Completed in {(time.perf_counter() - ts):f} seconds.', location='bottom')